@@ -2,9 +2,8 @@
 Configuration management for Costa Rica Electronic Invoice API
 """
 import secrets
-from typing import List, Optional, Union
-from pydantic import AnyHttpUrl, field_validator, ConfigDict
-from pydantic_settings import BaseSettings
+from typing import List, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -40,6 +39,7 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: Optional[str] = None
     REDIS_DB: int = 0
     REDIS_MAX_CONNECTIONS: int = 20
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # seconds
     
     # Rate limiting
     RATE_LIMIT_BASIC: int = 100  # requests per hour for basic plan
@@ -66,10 +66,14 @@ class Settings(BaseSettings):
     
     # Cache TTL (in seconds)
     CERTIFICATE_CACHE_TTL: int = 3600  # 1 hour
+    CERTIFICATE_LOCAL_CACHE_TTL: int = 60  # 1 minute (in-process, kept below Redis TTL)
+    CERTIFICATE_LOCAL_CACHE_SIZE: int = 128
     CABYS_CACHE_TTL: int = 86400  # 24 hours
+    CABYS_LOCAL_CACHE_TTL: int = 60  # 1 minute (in-process, kept below Redis TTL)
+    CABYS_LOCAL_CACHE_SIZE: int = 10000
     XSD_CACHE_TTL: int = 86400  # 24 hours
     
-    model_config = ConfigDict(
+    model_config = SettingsConfigDict(
         env_file=[".env.local", ".env"],  # Busca .env.local primero, luego .env
         case_sensitive=True
     )
@@ -1,7 +1,11 @@
 """
 Database connection and session management for Supabase PostgreSQL
 """
+from typing import Tuple
+
 from sqlalchemy import create_engine, MetaData
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
 
@@ -22,6 +26,54 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# libpq-only query parameters that asyncpg.connect() does not accept
+_LIBPQ_ONLY_PARAMS = frozenset({
+    "sslmode", "sslrootcert", "sslcert", "sslkey", "sslcrl", "sslpassword",
+    "channel_binding", "gssencmode", "connect_timeout", "application_name"
+})
+
+
+def make_async_database_url(database_url: str) -> Tuple[URL, dict]:
+    """
+    Build the asyncpg URL and connect_args from a libpq-style DATABASE_URL
+
+    asyncpg rejects libpq parameters such as sslmode=require (common in Supabase
+    URLs), so they are stripped from the query string; sslmode is translated to
+    asyncpg's ssl argument, which accepts the same mode names.
+    """
+    url = make_url(database_url)
+    connect_args = {}
+
+    sslmode = url.query.get("sslmode")
+    if sslmode:
+        connect_args["ssl"] = False if sslmode == "disable" else sslmode
+
+    query = {k: v for k, v in url.query.items() if k not in _LIBPQ_ONLY_PARAMS}
+    return url.set(drivername="postgresql+asyncpg", query=query), connect_args
+
+
+_async_database_url, _async_connect_args = make_async_database_url(settings.DATABASE_URL)
+
+# Async engine (asyncpg) for services running inside the event loop
+async_engine = create_async_engine(
+    _async_database_url,
+    connect_args=_async_connect_args,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=True,
+    echo=settings.LOG_LEVEL == "DEBUG"
+)
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create declarative base for models
 Base = declarative_base()
 
@@ -36,6 +88,11 @@ async def init_db():
     pass
 
 
+async def close_db():
+    """Dispose database connection pools"""
+    await async_engine.dispose()
+
+
 def get_db():
     """Dependency to get database session"""
     db = SessionLocal()
@@ -45,6 +102,12 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
 class DatabaseManager:
     """Database connection manager"""
     
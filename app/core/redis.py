@@ -1,9 +1,10 @@
 """
 Redis connection and utilities for caching and rate limiting
 """
-import json
+import orjson
 import redis.asyncio as redis
-from typing import Any, Optional, Union
+from cachetools import TTLCache
+from typing import Any, Dict, List, Optional, Union
 from datetime import timedelta
 
 from app.core.config import settings
@@ -22,9 +23,17 @@ class RedisManager:
             password=settings.REDIS_PASSWORD,
             db=settings.REDIS_DB,
             max_connections=settings.REDIS_MAX_CONNECTIONS,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            protocol=3,  # RESP3
             decode_responses=True
         )
     
+    async def _get_client(self) -> redis.Redis:
+        """Return the Redis client, connecting on first use"""
+        if not self.redis_client:
+            await self.connect()
+        return self.redis_client
+    
     async def disconnect(self):
         """Close Redis connection"""
         if self.redis_client:
@@ -32,61 +41,100 @@ class RedisManager:
     
     async def get(self, key: str) -> Optional[str]:
         """Get value from Redis"""
-        if not self.redis_client:
-            await self.connect()
-        return await self.redis_client.get(key)
+        client = await self._get_client()
+        return await client.get(key)
+    
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get multiple values from Redis in a single round trip"""
+        client = await self._get_client()
+        if not keys:
+            return []
+        return await client.mget(keys)
+    
+    async def set_many(self, items: Dict[str, Union[str, bytes, dict, list]], ttl: Optional[int] = None):
+        """Set multiple values in Redis with one pipelined round trip"""
+        client = await self._get_client()
+        if not items:
+            return
+        
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                if isinstance(value, (dict, list)):
+                    value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
     
     async def set(
         self, 
         key: str, 
-        value: Union[str, dict, list], 
+        value: Union[str, bytes, dict, list], 
         ttl: Optional[int] = None
     ) -> bool:
         """Set value in Redis with optional TTL"""
-        if not self.redis_client:
-            await self.connect()
+        client = await self._get_client()
         
         # Serialize complex objects to JSON
         if isinstance(value, (dict, list)):
-            value = json.dumps(value)
+            value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
         
         if ttl:
-            return await self.redis_client.setex(key, ttl, value)
+            return await client.setex(key, ttl, value)
         else:
-            return await self.redis_client.set(key, value)
+            return await client.set(key, value)
     
     async def delete(self, key: str) -> bool:
         """Delete key from Redis"""
-        if not self.redis_client:
-            await self.connect()
-        return bool(await self.redis_client.delete(key))
+        client = await self._get_client()
+        return bool(await client.delete(key))
+    
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Delete all keys matching pattern using SCAN + UNLINK in batches"""
+        client = await self._get_client()
+        
+        deleted = 0
+        batch = []
+        async for key in client.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await client.unlink(*batch)
+        return deleted
     
     async def exists(self, key: str) -> bool:
         """Check if key exists in Redis"""
-        if not self.redis_client:
-            await self.connect()
-        return bool(await self.redis_client.exists(key))
+        client = await self._get_client()
+        return bool(await client.exists(key))
     
     async def increment(self, key: str, amount: int = 1) -> int:
         """Increment counter in Redis"""
-        if not self.redis_client:
-            await self.connect()
-        return await self.redis_client.incrby(key, amount)
+        client = await self._get_client()
+        return await client.incrby(key, amount)
+    
+    async def increment_with_ttl(self, key: str, ttl: int, amount: int = 1) -> int:
+        """Increment counter, starting its TTL window on first use, in one round trip"""
+        client = await self._get_client()
+        # MULTI/EXEC so the key cannot expire between INCRBY and EXPIRE; EXPIRE NX
+        # (Redis 7+) only sets the TTL when the key has none, keeping the window fixed
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.incrby(key, amount)
+            pipe.expire(key, ttl, nx=True)
+            count, _ = await pipe.execute()
+        return count
     
     async def expire(self, key: str, ttl: int) -> bool:
         """Set TTL for existing key"""
-        if not self.redis_client:
-            await self.connect()
-        return await self.redis_client.expire(key, ttl)
+        client = await self._get_client()
+        return await client.expire(key, ttl)
     
     async def health_check(self) -> bool:
         """Check Redis connection health"""
         try:
-            if not self.redis_client:
-                await self.connect()
-            await self.redis_client.ping()
+            client = await self._get_client()
+            await client.ping()
             return True
-        except Exception:
+        except (redis.RedisError, OSError):
             return False
 
 
@@ -94,42 +142,107 @@ class RedisManager:
 redis_manager = RedisManager()
 
 
+# In-process L1 caches in front of Redis (L2). Entries hold the encoded JSON and
+# are decoded on every read, so callers never share a mutable cached object.
+_cabys_local_cache: TTLCache = TTLCache(
+    maxsize=settings.CABYS_LOCAL_CACHE_SIZE,
+    ttl=settings.CABYS_LOCAL_CACHE_TTL
+)
+_certificate_local_cache: TTLCache = TTLCache(
+    maxsize=settings.CERTIFICATE_LOCAL_CACHE_SIZE,
+    ttl=settings.CERTIFICATE_LOCAL_CACHE_TTL
+)
+
+
+async def _get_layered(local_cache: TTLCache, local_key: str, redis_key: str) -> Optional[Any]:
+    """Read a JSON value from the in-process cache, falling back to Redis"""
+    cached = local_cache.get(local_key)
+    if cached is None:
+        cached = await redis_manager.get(redis_key)
+        if not cached:
+            return None
+        local_cache[local_key] = cached
+    return orjson.loads(cached)
+
+
 class CacheService:
     """High-level caching service"""
     
     @staticmethod
     async def get_certificate(tenant_id: str) -> Optional[dict]:
-        """Get cached certificate for tenant"""
-        key = f"cert:{tenant_id}"
-        cached = await redis_manager.get(key)
-        if cached:
-            return json.loads(cached)
-        return None
+        """Get cached certificate for tenant (in-process cache first, then Redis)"""
+        return await _get_layered(_certificate_local_cache, tenant_id, f"cert:{tenant_id}")
     
     @staticmethod
     async def cache_certificate(tenant_id: str, certificate_data: dict):
         """Cache certificate for tenant"""
         key = f"cert:{tenant_id}"
-        await redis_manager.set(key, certificate_data, settings.CERTIFICATE_CACHE_TTL)
+        encoded = orjson.dumps(certificate_data, option=orjson.OPT_NON_STR_KEYS)
+        await redis_manager.set(key, encoded, settings.CERTIFICATE_CACHE_TTL)
+        _certificate_local_cache[tenant_id] = encoded
     
     @staticmethod
     async def get_cabys_code(code: str) -> Optional[dict]:
-        """Get cached CABYS code"""
-        key = f"cabys:{code}"
-        cached = await redis_manager.get(key)
-        if cached:
-            return json.loads(cached)
-        return None
+        """Get cached CABYS code (in-process cache first, then Redis)"""
+        return await _get_layered(_cabys_local_cache, code, f"cabys:{code}")
     
     @staticmethod
     async def cache_cabys_code(code: str, code_data: dict):
         """Cache CABYS code"""
         key = f"cabys:{code}"
-        await redis_manager.set(key, code_data, settings.CABYS_CACHE_TTL)
+        encoded = orjson.dumps(code_data, option=orjson.OPT_NON_STR_KEYS)
+        await redis_manager.set(key, encoded, settings.CABYS_CACHE_TTL)
+        _cabys_local_cache[code] = encoded
+    
+    @staticmethod
+    async def get_cabys_codes(codes: List[str]) -> Dict[str, Optional[dict]]:
+        """Get multiple cached CABYS codes with a single Redis MGET for L1 misses"""
+        result: Dict[str, Optional[dict]] = {}
+        misses = []
+        for code in codes:
+            cached = _cabys_local_cache.get(code)
+            if cached is not None:
+                result[code] = orjson.loads(cached)
+            else:
+                misses.append(code)
+        
+        if misses:
+            values = await redis_manager.mget([f"cabys:{code}" for code in misses])
+            for code, cached in zip(misses, values):
+                if cached:
+                    _cabys_local_cache[code] = cached
+                    result[code] = orjson.loads(cached)
+                else:
+                    result[code] = None
+        return result
+    
+    @staticmethod
+    async def cache_cabys_codes(codes_data: Dict[str, dict]):
+        """Cache multiple CABYS codes in one pipelined round trip"""
+        encoded = {
+            code: orjson.dumps(code_data, option=orjson.OPT_NON_STR_KEYS)
+            for code, code_data in codes_data.items()
+        }
+        await redis_manager.set_many(
+            {f"cabys:{code}": value for code, value in encoded.items()},
+            settings.CABYS_CACHE_TTL
+        )
+        _cabys_local_cache.update(encoded)
+    
+    @staticmethod
+    async def clear_cabys_cache(code: Optional[str] = None) -> int:
+        """Clear a single cached CABYS code, or all of them"""
+        if code:
+            _cabys_local_cache.pop(code, None)
+            return int(await redis_manager.delete(f"cabys:{code}"))
+        
+        _cabys_local_cache.clear()
+        return await redis_manager.delete_pattern("cabys:*")
     
     @staticmethod
     async def invalidate_tenant_cache(tenant_id: str):
         """Invalidate all cache entries for a tenant"""
+        _certificate_local_cache.pop(tenant_id, None)
         await redis_manager.delete(f"cert:{tenant_id}")
 
 
@@ -160,11 +273,7 @@ class RateLimitService:
         if current_count >= limit:
             return False, current_count, limit
         
-        # Increment counter
-        new_count = await redis_manager.increment(key)
-        
-        # Set expiration if this is the first request in the window
-        if new_count == 1:
-            await redis_manager.expire(key, 3600)  # 1 hour window
+        # Increment counter, starting a 1 hour window if this is the first request
+        new_count = await redis_manager.increment_with_ttl(key, 3600)
         
         return True, new_count, limit
\ No newline at end of file
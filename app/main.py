@@ -6,7 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.database import init_db, close_db
 from app.api.v1.api import api_router
 
 
@@ -17,7 +17,7 @@ async def lifespan(app: FastAPI):
     await init_db()
     yield
     # Shutdown
-    pass
+    await close_db()
 
 
 def create_application() -> FastAPI:
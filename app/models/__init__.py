@@ -9,6 +9,7 @@ from .document_reference import DocumentReference, ReferenceDocumentType, Refere
 from .document_tax import DocumentTax, TaxCode, IVATariffCode
 from .document_exemption import DocumentExemption, ExemptionDocumentType, ExemptionInstitution
 from .document_other_charge import DocumentOtherCharge, OtherChargeType
+from .consecutive_counter import ConsecutiveCounter
 
 __all__ = [
     "Tenant",
@@ -32,4 +33,5 @@ __all__ = [
     "ExemptionInstitution",
     "DocumentOtherCharge",
     "OtherChargeType",
+    "ConsecutiveCounter",
 ]
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+ConsecutiveCounter model for atomic consecutive number allocation per branch and terminal
+"""
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import (
+    Column, String, BigInteger, DateTime, ForeignKey, CheckConstraint, func, cast, select,
+    Enum as SQLEnum
+)
+from sqlalchemy.dialects.postgresql import UUID, Insert, insert
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models.document import Document, DocumentType
+
+
+class ConsecutiveCounter(Base):
+    """
+    Last sequential number issued per tenant, document type, branch and terminal
+
+    Allocation is a single INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement,
+    so concurrent requests are serialized by the counter row lock instead of racing
+    on a MAX(numero_consecutivo) scan over the documents table. The first allocation
+    for a sequence seeds the counter from the highest number already issued in
+    documentos, so tenants with existing documents continue their numbering.
+
+    Requirements: 9.4, 10.4
+    """
+    __tablename__ = "contadores_consecutivos"
+
+    # Composite primary key (one counter per numbering sequence)
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"),
+                      primary_key=True, comment="Tenant owner of the sequence")
+    tipo_documento = Column(SQLEnum(DocumentType), primary_key=True,
+                          comment="Document type: 01-07")
+    sucursal = Column(String(3), primary_key=True, comment="Branch code (3 digits)")
+    terminal = Column(String(5), primary_key=True, comment="Terminal/point of sale code (5 digits)")
+
+    # Sequence state
+    ultimo_consecutivo = Column(BigInteger, nullable=False, default=0,
+                              comment="Last sequential number issued (10 digits max)")
+
+    # Audit fields
+    created_at = Column(DateTime(timezone=True), nullable=False,
+                       default=lambda: datetime.now(timezone.utc),
+                       server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), nullable=False,
+                       default=lambda: datetime.now(timezone.utc),
+                       onupdate=lambda: datetime.now(timezone.utc),
+                       server_default=func.now())
+
+    # Table constraints
+    __table_args__ = (
+        CheckConstraint(
+            "sucursal ~ '^\\d{3}$'",
+            name="ck_consecutive_sucursal_format"
+        ),
+        CheckConstraint(
+            "terminal ~ '^\\d{5}$'",
+            name="ck_consecutive_terminal_format"
+        ),
+        CheckConstraint(
+            "ultimo_consecutivo >= 0 AND ultimo_consecutivo <= 9999999999",
+            name="ck_consecutive_ultimo_range"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ConsecutiveCounter(tenant_id={self.tenant_id}, tipo={self.tipo_documento.value}, "
+            f"sucursal='{self.sucursal}', terminal='{self.terminal}', ultimo={self.ultimo_consecutivo})>"
+        )
+
+    @classmethod
+    def next_sequential(cls, db: Session, tenant_id: uuid.UUID, tipo_documento: DocumentType,
+                        sucursal: str, terminal: str) -> int:
+        """
+        Atomically allocate the next sequential number for a numbering sequence
+
+        Creates the counter on first use. Runs in the caller's transaction, so the
+        number is only consumed if that transaction commits.
+        """
+        return cls.reserve_sequentials(db, tenant_id, tipo_documento, sucursal, terminal, 1)[0]
+
+    @classmethod
+    def reserve_sequentials(cls, db: Session, tenant_id: uuid.UUID, tipo_documento: DocumentType,
+                            sucursal: str, terminal: str, count: int) -> range:
+        """
+        Atomically reserve a block of consecutive sequential numbers in one round trip
+
+        Used for bulk document ingestion; returns the reserved numbers in order.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1")
+
+        stmt = cls._reserve_statement(tenant_id, tipo_documento, sucursal, terminal, count)
+        last = db.execute(stmt).scalar_one()
+        return range(last - count + 1, last + 1)
+
+    @classmethod
+    def _reserve_statement(cls, tenant_id: uuid.UUID, tipo_documento: DocumentType,
+                           sucursal: str, terminal: str, count: int) -> Insert:
+        """Build the UPSERT that reserves count numbers and returns the last one"""
+        # numero_consecutivo = sucursal(3) + terminal(5) + tipo(2) + sequential(10)
+        prefix = f"{sucursal}{terminal}{tipo_documento.value}"
+        last_issued = select(
+            func.coalesce(
+                cast(func.substr(func.max(Document.numero_consecutivo), 11), BigInteger),
+                0
+            )
+        ).where(
+            Document.tenant_id == tenant_id,
+            Document.tipo_documento == tipo_documento,
+            Document.numero_consecutivo.between(f"{prefix}0000000000", f"{prefix}9999999999")
+        ).scalar_subquery()
+
+        return insert(cls).values(
+            tenant_id=tenant_id,
+            tipo_documento=tipo_documento,
+            sucursal=sucursal,
+            terminal=terminal,
+            ultimo_consecutivo=last_issued + count
+        ).on_conflict_do_update(
+            index_elements=[cls.tenant_id, cls.tipo_documento, cls.sucursal, cls.terminal],
+            set_={
+                "ultimo_consecutivo": cls.ultimo_consecutivo + count,
+                "updated_at": func.now()
+            }
+        ).returning(cls.ultimo_consecutivo)
@@ -3,6 +3,7 @@ Unified Document model supporting all 7 Costa Rican electronic document types
 """
 import uuid
 from datetime import datetime, timezone
+from types import MappingProxyType
 from decimal import Decimal
 from typing import Optional
 from sqlalchemy import (
@@ -77,6 +78,31 @@ class PaymentMethod(enum.Enum):
     OTROS = "99"
 
 
+# Human-readable document type names
+_DOCUMENT_TYPE_NAMES = MappingProxyType({
+    DocumentType.FACTURA_ELECTRONICA: "Factura Electrónica",
+    DocumentType.NOTA_DEBITO_ELECTRONICA: "Nota de Débito Electrónica",
+    DocumentType.NOTA_CREDITO_ELECTRONICA: "Nota de Crédito Electrónica",
+    DocumentType.TIQUETE_ELECTRONICO: "Tiquete Electrónico",
+    DocumentType.FACTURA_EXPORTACION: "Factura Electrónica de Exportación",
+    DocumentType.FACTURA_COMPRA: "Factura Electrónica de Compra",
+    DocumentType.RECIBO_PAGO: "Recibo Electrónico de Pago"
+})
+
+
+# Document types that reference another document (credit/debit notes)
+_REFERENCE_DOCUMENT_TYPES = frozenset({
+    DocumentType.NOTA_CREDITO_ELECTRONICA,
+    DocumentType.NOTA_DEBITO_ELECTRONICA
+})
+
+# Statuses from which a document can be (re)sent to the Ministry
+_SENDABLE_STATUSES = frozenset({DocumentStatus.BORRADOR, DocumentStatus.ERROR})
+
+# Terminal document statuses
+_FINAL_STATUSES = frozenset({DocumentStatus.ACEPTADO, DocumentStatus.CANCELADO})
+
+
 class Document(Base):
     """
     Unified Document model supporting all 7 Costa Rican electronic document types
@@ -304,7 +330,6 @@ class Document(Base):
         
         # Performance indexes
         Index("idx_documentos_tenant_id", "tenant_id"),
-        Index("idx_documentos_clave", "clave"),
         Index("idx_documentos_tipo", "tipo_documento"),
         Index("idx_documentos_estado", "estado"),
         Index("idx_documentos_fecha_emision", "fecha_emision"),
@@ -315,14 +340,22 @@ class Document(Base):
         Index("idx_documentos_fecha_procesamiento", "fecha_procesamiento"),
         
         # Composite indexes for common queries
-        Index("idx_documentos_tenant_tipo", "tenant_id", "tipo_documento"),
+        Index("idx_documentos_tenant_tipo_consecutivo", "tenant_id", "tipo_documento", "numero_consecutivo"),
         Index("idx_documentos_tenant_estado", "tenant_id", "estado"),
         Index("idx_documentos_tenant_fecha", "tenant_id", "fecha_emision"),
         Index("idx_documentos_estado_fecha", "estado", "fecha_emision"),
         Index("idx_documentos_tipo_fecha", "tipo_documento", "fecha_emision"),
         Index("idx_documentos_emisor_fecha", "emisor_numero_identificacion", "fecha_emision"),
         Index("idx_documentos_receptor_fecha", "receptor_numero_identificacion", "fecha_emision"),
-        
+
+        # Trigram indexes for ILIKE '%term%' search on free-text name/email columns
+        Index("idx_documentos_emisor_nombre_gin", "emisor_nombre", postgresql_using="gin",
+              postgresql_ops={"emisor_nombre": "gin_trgm_ops"}),
+        Index("idx_documentos_receptor_nombre_gin", "receptor_nombre", postgresql_using="gin",
+              postgresql_ops={"receptor_nombre": "gin_trgm_ops"}),
+        Index("idx_documentos_receptor_correo_gin", "receptor_correo_electronico", postgresql_using="gin",
+              postgresql_ops={"receptor_correo_electronico": "gin_trgm_ops"}),
+
         # Indexes for Ministry processing
         Index("idx_documentos_pendiente_envio", "estado", "proximo_intento"),
         Index("idx_documentos_intentos", "intentos_envio", "estado"),
@@ -357,16 +390,13 @@ class Document(Base):
     @property
     def is_reference_document(self) -> bool:
         """Check if this document references another (credit/debit notes)"""
-        return self.tipo_documento in [
-            DocumentType.NOTA_CREDITO_ELECTRONICA,
-            DocumentType.NOTA_DEBITO_ELECTRONICA
-        ]
+        return self.tipo_documento in _REFERENCE_DOCUMENT_TYPES
     
     @property
     def can_be_sent(self) -> bool:
         """Check if document can be sent to Ministry"""
         return (
-            self.estado in [DocumentStatus.BORRADOR, DocumentStatus.ERROR] and
+            self.estado in _SENDABLE_STATUSES and
             self.xml_firmado is not None and
             self.tenant.activo and
             self.tenant.has_certificate and
@@ -376,10 +406,7 @@ class Document(Base):
     @property
     def is_final(self) -> bool:
         """Check if document is in final state"""
-        return self.estado in [
-            DocumentStatus.ACEPTADO,
-            DocumentStatus.CANCELADO
-        ]
+        return self.estado in _FINAL_STATUSES
     
     @property
     def needs_retry(self) -> bool:
@@ -392,9 +419,29 @@ class Document(Base):
         )
     
     def calculate_totals(self) -> None:
-        """Calculate document totals from line items (to be implemented with details)"""
-        # This will be implemented when DocumentDetail model is created
-        pass
+        """Calculate document totals from line items and other charges in a single pass"""
+        total_venta = Decimal('0')
+        total_descuento = Decimal('0')
+        total_impuesto = Decimal('0')
+
+        for detalle in self.detalles:
+            total_venta += detalle.monto_total
+            total_descuento += detalle.monto_descuento or Decimal('0')
+            for impuesto in detalle.impuestos:
+                # Net tax: exempted amounts are not charged to the receiver
+                total_impuesto += impuesto.monto
+                for exoneracion in impuesto.exoneraciones:
+                    total_impuesto -= exoneracion.monto_exoneracion
+
+        total_otros_cargos = Decimal('0')
+        for cargo in self.otros_cargos:
+            total_otros_cargos += cargo.monto_cargo
+
+        self.total_venta_neta = total_venta - total_descuento
+        self.total_descuento = total_descuento
+        self.total_impuesto = total_impuesto
+        self.total_otros_cargos = total_otros_cargos
+        self.total_comprobante = self.total_venta_neta + total_impuesto + total_otros_cargos
     
     def increment_retry_count(self) -> None:
         """Increment retry count and set next retry time"""
@@ -441,16 +488,7 @@ class Document(Base):
     
     def get_document_type_name(self) -> str:
         """Get human-readable document type name"""
-        type_names = {
-            DocumentType.FACTURA_ELECTRONICA: "Factura Electrónica",
-            DocumentType.NOTA_DEBITO_ELECTRONICA: "Nota de Débito Electrónica",
-            DocumentType.NOTA_CREDITO_ELECTRONICA: "Nota de Crédito Electrónica",
-            DocumentType.TIQUETE_ELECTRONICO: "Tiquete Electrónico",
-            DocumentType.FACTURA_EXPORTACION: "Factura Electrónica de Exportación",
-            DocumentType.FACTURA_COMPRA: "Factura Electrónica de Compra",
-            DocumentType.RECIBO_PAGO: "Recibo Electrónico de Pago"
-        }
-        return type_names.get(self.tipo_documento, "Documento Desconocido")
+        return _DOCUMENT_TYPE_NAMES.get(self.tipo_documento, "Documento Desconocido")
     
     def to_dict(self) -> dict:
         """Convert document to dictionary for API responses"""
@@ -1,6 +1,7 @@
 """
 DocumentDetail model for invoice line items with product identification and pricing
 """
+import re
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -16,6 +17,16 @@ import enum
 from app.core.database import Base
 
 
+# 13-digit CABYS code format
+_CABYS_CODE_PATTERN = re.compile(r'^\d{13}$')
+
+# Valid commercial code types (see CommercialCodeType)
+_COMMERCIAL_CODE_TYPES = frozenset({'01', '02', '03', '04', '99'})
+
+# Required keys for each package component in detalle_surtido
+_PACKAGE_COMPONENT_FIELDS = frozenset({'codigo_cabys', 'cantidad', 'unidad_medida', 'descripcion'})
+
+
 class TransactionType(enum.Enum):
     """Transaction types for special tax treatments"""
     VENTA_NORMAL = "01"
@@ -248,8 +259,7 @@ class DocumentDetail(Base):
     
     def validate_cabys_code(self) -> bool:
         """Validate CABYS code format"""
-        import re
-        return bool(re.match(r'^\d{13}$', self.codigo_cabys))
+        return bool(_CABYS_CODE_PATTERN.match(self.codigo_cabys))
     
     def validate_commercial_codes(self) -> bool:
         """Validate commercial codes structure"""
@@ -267,7 +277,7 @@ class DocumentDetail(Base):
                 return False
             if 'tipo' not in code or 'codigo' not in code:
                 return False
-            if code['tipo'] not in ['01', '02', '03', '04', '99']:
+            if code['tipo'] not in _COMMERCIAL_CODE_TYPES:
                 return False
             if not isinstance(code['codigo'], str) or len(code['codigo']) > 20:
                 return False
@@ -289,14 +299,11 @@ class DocumentDetail(Base):
             if not isinstance(component, dict):
                 return False
             
-            required_fields = ['codigo_cabys', 'cantidad', 'unidad_medida', 'descripcion']
-            for field in required_fields:
-                if field not in component:
-                    return False
+            if not _PACKAGE_COMPONENT_FIELDS <= component.keys():
+                return False
             
             # Validate CABYS code format
-            import re
-            if not re.match(r'^\d{13}$', component['codigo_cabys']):
+            if not _CABYS_CODE_PATTERN.match(component['codigo_cabys']):
                 return False
             
             # Validate quantity is positive
@@ -322,7 +329,7 @@ class DocumentDetail(Base):
         if len(self.codigos_comerciales) >= 5:
             return False
         
-        if tipo not in ['01', '02', '03', '04', '99']:
+        if tipo not in _COMMERCIAL_CODE_TYPES:
             return False
         
         if len(codigo) > 20:
@@ -349,8 +356,7 @@ class DocumentDetail(Base):
             return False
         
         # Validate inputs
-        import re
-        if not re.match(r'^\d{13}$', codigo_cabys):
+        if not _CABYS_CODE_PATTERN.match(codigo_cabys):
             return False
         
         if cantidad <= 0:
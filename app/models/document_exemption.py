@@ -3,6 +3,7 @@ DocumentExemption model for tax exemption handling
 """
 import uuid
 from datetime import datetime, timezone
+from types import MappingProxyType
 from decimal import Decimal
 from sqlalchemy import (
     Column, String, Integer, DateTime, Numeric, ForeignKey, CheckConstraint, Index, func, Enum as SQLEnum
@@ -47,6 +48,40 @@ class ExemptionInstitution(enum.Enum):
     OTROS = "99"
 
 
+# Human-readable exemption document type names
+_EXEMPTION_DOCUMENT_TYPE_NAMES = MappingProxyType({
+    ExemptionDocumentType.AUTORIZACION_DGT_COMPRAS: "Autorización DGT para compras autorizadas",
+    ExemptionDocumentType.VENTAS_DIPLOMATICAS: "Ventas diplomáticas",
+    ExemptionDocumentType.AUTORIZACION_LEY_ESPECIAL: "Autorización por ley especial",
+    ExemptionDocumentType.AUTORIZACION_GENERAL_LOCAL: "Autorización general local",
+    ExemptionDocumentType.SERVICIOS_INGENIERIA_TRANSITORIO: "Servicios de ingeniería (transitorio)",
+    ExemptionDocumentType.SERVICIOS_TURISTICOS_ICT: "Servicios turísticos ICT",
+    ExemptionDocumentType.RECICLAJE_TRANSITORIO: "Reciclaje (transitorio)",
+    ExemptionDocumentType.ZONA_FRANCA: "Zona franca",
+    ExemptionDocumentType.SERVICIOS_COMPLEMENTARIOS_EXPORTACION: "Servicios complementarios de exportación",
+    ExemptionDocumentType.CORPORACIONES_MUNICIPALES: "Corporaciones municipales",
+    ExemptionDocumentType.AUTORIZACION_ESPECIFICA_LOCAL: "Autorización específica local",
+    ExemptionDocumentType.OTROS: "Otros"
+})
+
+# Human-readable exemption institution names
+_INSTITUTION_NAMES = MappingProxyType({
+    ExemptionInstitution.DIRECCION_GENERAL_TRIBUTACION: "Dirección General de Tributación",
+    ExemptionInstitution.MINISTERIO_RELACIONES_EXTERIORES: "Ministerio de Relaciones Exteriores",
+    ExemptionInstitution.TRIBUNAL_SUPREMO_ELECCIONES: "Tribunal Supremo de Elecciones",
+    ExemptionInstitution.CONTRALORIA_GENERAL_REPUBLICA: "Contraloría General de la República",
+    ExemptionInstitution.INSTITUTO_COSTARRICENSE_TURISMO: "Instituto Costarricense de Turismo",
+    ExemptionInstitution.COMISION_NACIONAL_EMERGENCIAS: "Comisión Nacional de Emergencias",
+    ExemptionInstitution.INSTITUTO_MIXTO_AYUDA_SOCIAL: "Instituto Mixto de Ayuda Social",
+    ExemptionInstitution.CONSEJO_NACIONAL_REHABILITACION: "Consejo Nacional de Rehabilitación",
+    ExemptionInstitution.PATRONATO_NACIONAL_INFANCIA: "Patronato Nacional de la Infancia",
+    ExemptionInstitution.CRUZ_ROJA_COSTARRICENSE: "Cruz Roja Costarricense",
+    ExemptionInstitution.JUNTA_PROTECCION_SOCIAL: "Junta de Protección Social",
+    ExemptionInstitution.CUALQUIER_INSTITUCION_PUBLICA: "Cualquier institución pública",
+    ExemptionInstitution.OTROS: "Otros"
+})
+
+
 class DocumentExemption(Base):
     """
     Tax exemption information for document line items
@@ -184,40 +219,11 @@ class DocumentExemption(Base):
     
     def get_document_type_name(self) -> str:
         """Get human-readable exemption document type name"""
-        type_names = {
-            ExemptionDocumentType.AUTORIZACION_DGT_COMPRAS: "Autorización DGT para compras autorizadas",
-            ExemptionDocumentType.VENTAS_DIPLOMATICAS: "Ventas diplomáticas",
-            ExemptionDocumentType.AUTORIZACION_LEY_ESPECIAL: "Autorización por ley especial",
-            ExemptionDocumentType.AUTORIZACION_GENERAL_LOCAL: "Autorización general local",
-            ExemptionDocumentType.SERVICIOS_INGENIERIA_TRANSITORIO: "Servicios de ingeniería (transitorio)",
-            ExemptionDocumentType.SERVICIOS_TURISTICOS_ICT: "Servicios turísticos ICT",
-            ExemptionDocumentType.RECICLAJE_TRANSITORIO: "Reciclaje (transitorio)",
-            ExemptionDocumentType.ZONA_FRANCA: "Zona franca",
-            ExemptionDocumentType.SERVICIOS_COMPLEMENTARIOS_EXPORTACION: "Servicios complementarios de exportación",
-            ExemptionDocumentType.CORPORACIONES_MUNICIPALES: "Corporaciones municipales",
-            ExemptionDocumentType.AUTORIZACION_ESPECIFICA_LOCAL: "Autorización específica local",
-            ExemptionDocumentType.OTROS: "Otros"
-        }
-        return type_names.get(self.tipo_documento_exoneracion, "Tipo Desconocido")
+        return _EXEMPTION_DOCUMENT_TYPE_NAMES.get(self.tipo_documento_exoneracion, "Tipo Desconocido")
     
     def get_institution_name(self) -> str:
         """Get human-readable institution name"""
-        institution_names = {
-            ExemptionInstitution.DIRECCION_GENERAL_TRIBUTACION: "Dirección General de Tributación",
-            ExemptionInstitution.MINISTERIO_RELACIONES_EXTERIORES: "Ministerio de Relaciones Exteriores",
-            ExemptionInstitution.TRIBUNAL_SUPREMO_ELECCIONES: "Tribunal Supremo de Elecciones",
-            ExemptionInstitution.CONTRALORIA_GENERAL_REPUBLICA: "Contraloría General de la República",
-            ExemptionInstitution.INSTITUTO_COSTARRICENSE_TURISMO: "Instituto Costarricense de Turismo",
-            ExemptionInstitution.COMISION_NACIONAL_EMERGENCIAS: "Comisión Nacional de Emergencias",
-            ExemptionInstitution.INSTITUTO_MIXTO_AYUDA_SOCIAL: "Instituto Mixto de Ayuda Social",
-            ExemptionInstitution.CONSEJO_NACIONAL_REHABILITACION: "Consejo Nacional de Rehabilitación",
-            ExemptionInstitution.PATRONATO_NACIONAL_INFANCIA: "Patronato Nacional de la Infancia",
-            ExemptionInstitution.CRUZ_ROJA_COSTARRICENSE: "Cruz Roja Costarricense",
-            ExemptionInstitution.JUNTA_PROTECCION_SOCIAL: "Junta de Protección Social",
-            ExemptionInstitution.CUALQUIER_INSTITUCION_PUBLICA: "Cualquier institución pública",
-            ExemptionInstitution.OTROS: "Otros"
-        }
-        return institution_names.get(self.nombre_institucion, "Institución Desconocida")
+        return _INSTITUTION_NAMES.get(self.nombre_institucion, "Institución Desconocida")
     
     def get_full_document_reference(self) -> str:
         """Get full document reference including article and subsection"""
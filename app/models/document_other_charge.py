@@ -3,6 +3,7 @@ DocumentOtherCharge model for stamps and additional fees
 """
 import uuid
 from datetime import datetime, timezone
+from types import MappingProxyType
 from decimal import Decimal
 from typing import Optional
 from sqlalchemy import (
@@ -31,6 +32,36 @@ class OtherChargeType(enum.Enum):
     OTROS = "99"
 
 
+# Human-readable other charge type names
+_CHARGE_TYPE_NAMES = MappingProxyType({
+    OtherChargeType.CONTRIBUCION_PARAFISCAL: "Contribución Parafiscal",
+    OtherChargeType.TIMBRE_CRUZ_ROJA: "Timbre Cruz Roja",
+    OtherChargeType.TIMBRE_BOMBEROS: "Timbre Bomberos",
+    OtherChargeType.COBRO_TERCERO: "Cobro a Tercero",
+    OtherChargeType.GASTOS_EXPORTACION: "Gastos de Exportación",
+    OtherChargeType.IMPUESTO_SERVICIO_10_PERCENT: "Impuesto al Servicio 10%",
+    OtherChargeType.TIMBRES_COLEGIOS_PROFESIONALES: "Timbres Colegios Profesionales",
+    OtherChargeType.DEPOSITOS_GARANTIA: "Depósitos de Garantía",
+    OtherChargeType.MULTAS_SANCIONES: "Multas y Sanciones",
+    OtherChargeType.INTERESES_MORATORIOS: "Intereses Moratorios",
+    OtherChargeType.OTROS: "Otros Cargos"
+})
+
+
+# Stamp (timbre) charge types
+_STAMP_CHARGE_TYPES = frozenset({
+    OtherChargeType.TIMBRE_CRUZ_ROJA,
+    OtherChargeType.TIMBRE_BOMBEROS,
+    OtherChargeType.TIMBRES_COLEGIOS_PROFESIONALES
+})
+
+# Tax-like charge types
+_TAX_CHARGE_TYPES = frozenset({
+    OtherChargeType.CONTRIBUCION_PARAFISCAL,
+    OtherChargeType.IMPUESTO_SERVICIO_10_PERCENT
+})
+
+
 class DocumentOtherCharge(Base):
     """
     Other charges for documents including stamps and additional fees
@@ -159,36 +190,16 @@ class DocumentOtherCharge(Base):
     @property
     def is_stamp(self) -> bool:
         """Check if charge is a stamp (timbre)"""
-        return self.tipo_documento in [
-            OtherChargeType.TIMBRE_CRUZ_ROJA,
-            OtherChargeType.TIMBRE_BOMBEROS,
-            OtherChargeType.TIMBRES_COLEGIOS_PROFESIONALES
-        ]
+        return self.tipo_documento in _STAMP_CHARGE_TYPES
     
     @property
     def is_tax(self) -> bool:
         """Check if charge is a tax"""
-        return self.tipo_documento in [
-            OtherChargeType.CONTRIBUCION_PARAFISCAL,
-            OtherChargeType.IMPUESTO_SERVICIO_10_PERCENT
-        ]
+        return self.tipo_documento in _TAX_CHARGE_TYPES
     
     def get_charge_type_name(self) -> str:
         """Get human-readable charge type name"""
-        type_names = {
-            OtherChargeType.CONTRIBUCION_PARAFISCAL: "Contribución Parafiscal",
-            OtherChargeType.TIMBRE_CRUZ_ROJA: "Timbre Cruz Roja",
-            OtherChargeType.TIMBRE_BOMBEROS: "Timbre Bomberos",
-            OtherChargeType.COBRO_TERCERO: "Cobro a Tercero",
-            OtherChargeType.GASTOS_EXPORTACION: "Gastos de Exportación",
-            OtherChargeType.IMPUESTO_SERVICIO_10_PERCENT: "Impuesto al Servicio 10%",
-            OtherChargeType.TIMBRES_COLEGIOS_PROFESIONALES: "Timbres Colegios Profesionales",
-            OtherChargeType.DEPOSITOS_GARANTIA: "Depósitos de Garantía",
-            OtherChargeType.MULTAS_SANCIONES: "Multas y Sanciones",
-            OtherChargeType.INTERESES_MORATORIOS: "Intereses Moratorios",
-            OtherChargeType.OTROS: "Otros Cargos"
-        }
-        return type_names.get(self.tipo_documento, "Cargo Desconocido")
+        return _CHARGE_TYPE_NAMES.get(self.tipo_documento, "Cargo Desconocido")
     
     def get_third_party_info(self) -> Optional[dict]:
         """Get third party information as dictionary"""
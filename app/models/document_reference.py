@@ -3,6 +3,7 @@ DocumentReference model for credit/debit note relationships and document correct
 """
 import uuid
 from datetime import datetime, timezone
+from types import MappingProxyType
 from sqlalchemy import (
     Column, String, DateTime, Text, ForeignKey, CheckConstraint, Index, func, Enum as SQLEnum
 )
@@ -52,6 +53,53 @@ class ReferenceCode(enum.Enum):
     OTROS = "99"
 
 
+# Human-readable reference document type names
+_REFERENCE_TYPE_NAMES = MappingProxyType({
+    ReferenceDocumentType.FACTURA_ELECTRONICA: "Factura Electrónica",
+    ReferenceDocumentType.NOTA_DEBITO_ELECTRONICA: "Nota de Débito Electrónica",
+    ReferenceDocumentType.NOTA_CREDITO_ELECTRONICA: "Nota de Crédito Electrónica",
+    ReferenceDocumentType.TIQUETE_ELECTRONICO: "Tiquete Electrónico",
+    ReferenceDocumentType.NOTA_DESPACHO: "Nota de Despacho",
+    ReferenceDocumentType.CONTRATO: "Contrato",
+    ReferenceDocumentType.PROCEDIMIENTO: "Procedimiento",
+    ReferenceDocumentType.COMPROBANTE_CONTINGENCIA: "Comprobante de Contingencia",
+    ReferenceDocumentType.DEVOLUCION_MERCANCIA: "Devolución de Mercancía",
+    ReferenceDocumentType.RECHAZADO_MINISTERIO: "Rechazado por Ministerio",
+    ReferenceDocumentType.RECHAZADO_RECEPTOR_SUSTITUTO: "Rechazado por Receptor - Sustituto",
+    ReferenceDocumentType.SUSTITUTO_FACTURA_EXPORTACION: "Sustituto Factura de Exportación",
+    ReferenceDocumentType.FACTURACION_MES_ANTERIOR: "Facturación Mes Anterior",
+    ReferenceDocumentType.COMPROBANTE_REGIMEN_ESPECIAL: "Comprobante Régimen Especial",
+    ReferenceDocumentType.SUSTITUTO_FACTURA_COMPRA: "Sustituto Factura de Compra",
+    ReferenceDocumentType.PROVEEDOR_NO_DOMICILIADO: "Proveedor No Domiciliado",
+    ReferenceDocumentType.NOTA_CREDITO_FACTURA_COMPRA: "Nota de Crédito a Factura de Compra",
+    ReferenceDocumentType.NOTA_DEBITO_FACTURA_COMPRA: "Nota de Débito a Factura de Compra",
+    ReferenceDocumentType.OTROS: "Otros"
+})
+
+# Human-readable reference code names
+_REFERENCE_CODE_NAMES = MappingProxyType({
+    ReferenceCode.ANULA_DOCUMENTO_REFERENCIA: "Anula documento de referencia",
+    ReferenceCode.CORRIGE_TEXTO_DOCUMENTO_REFERENCIA: "Corrige texto del documento de referencia",
+    ReferenceCode.REFERENCIA_OTRO_DOCUMENTO: "Referencia a otro documento",
+    ReferenceCode.SUSTITUYE_COMPROBANTE_CONTINGENCIA: "Sustituye comprobante por contingencia",
+    ReferenceCode.DEVOLUCION_MERCANCIA: "Devolución de mercancía",
+    ReferenceCode.SUSTITUYE_COMPROBANTE_ELECTRONICO: "Sustituye comprobante electrónico",
+    ReferenceCode.FACTURA_ENDOSADA: "Factura endosada",
+    ReferenceCode.NOTA_CREDITO_FINANCIERA: "Nota de crédito financiera",
+    ReferenceCode.NOTA_DEBITO_FINANCIERA: "Nota de débito financiera",
+    ReferenceCode.PROVEEDOR_NO_DOMICILIADO: "Proveedor no domiciliado",
+    ReferenceCode.NOTA_CREDITO_EXONERACION_POSTERIOR: "Nota de crédito por exoneración posterior",
+    ReferenceCode.OTROS: "Otros"
+})
+
+
+# Reference codes that substitute the referenced document
+_SUBSTITUTION_CODES = frozenset({
+    ReferenceCode.SUSTITUYE_COMPROBANTE_CONTINGENCIA,
+    ReferenceCode.SUSTITUYE_COMPROBANTE_ELECTRONICO
+})
+
+
 class DocumentReference(Base):
     """
     Document references for credit/debit notes, corrections, and cancellations
@@ -134,7 +182,6 @@ class DocumentReference(Base):
         
         # Performance indexes
         Index("idx_referencias_documento_id", "documento_id"),
-        Index("idx_referencias_numero", "numero_referencia"),
         Index("idx_referencias_tipo", "tipo_documento_referencia"),
         Index("idx_referencias_codigo", "codigo_referencia"),
         Index("idx_referencias_fecha", "fecha_emision_referencia"),
@@ -143,6 +190,7 @@ class DocumentReference(Base):
         # Composite indexes for common queries
         Index("idx_referencias_documento_tipo", "documento_id", "tipo_documento_referencia"),
         Index("idx_referencias_numero_fecha", "numero_referencia", "fecha_emision_referencia"),
+        Index("idx_referencias_numero_documento", "numero_referencia", "documento_id"),
     )
     
     def __repr__(self) -> str:
@@ -164,10 +212,7 @@ class DocumentReference(Base):
     @property
     def is_substitution(self) -> bool:
         """Check if this reference is a substitution"""
-        return self.codigo_referencia in [
-            ReferenceCode.SUSTITUYE_COMPROBANTE_CONTINGENCIA,
-            ReferenceCode.SUSTITUYE_COMPROBANTE_ELECTRONICO
-        ]
+        return self.codigo_referencia in _SUBSTITUTION_CODES
     
     @property
     def requires_other_description(self) -> bool:
@@ -179,49 +224,14 @@ class DocumentReference(Base):
     
     def get_reference_type_name(self) -> str:
         """Get human-readable reference type name"""
-        type_names = {
-            ReferenceDocumentType.FACTURA_ELECTRONICA: "Factura Electrónica",
-            ReferenceDocumentType.NOTA_DEBITO_ELECTRONICA: "Nota de Débito Electrónica",
-            ReferenceDocumentType.NOTA_CREDITO_ELECTRONICA: "Nota de Crédito Electrónica",
-            ReferenceDocumentType.TIQUETE_ELECTRONICO: "Tiquete Electrónico",
-            ReferenceDocumentType.NOTA_DESPACHO: "Nota de Despacho",
-            ReferenceDocumentType.CONTRATO: "Contrato",
-            ReferenceDocumentType.PROCEDIMIENTO: "Procedimiento",
-            ReferenceDocumentType.COMPROBANTE_CONTINGENCIA: "Comprobante de Contingencia",
-            ReferenceDocumentType.DEVOLUCION_MERCANCIA: "Devolución de Mercancía",
-            ReferenceDocumentType.RECHAZADO_MINISTERIO: "Rechazado por Ministerio",
-            ReferenceDocumentType.RECHAZADO_RECEPTOR_SUSTITUTO: "Rechazado por Receptor - Sustituto",
-            ReferenceDocumentType.SUSTITUTO_FACTURA_EXPORTACION: "Sustituto Factura de Exportación",
-            ReferenceDocumentType.FACTURACION_MES_ANTERIOR: "Facturación Mes Anterior",
-            ReferenceDocumentType.COMPROBANTE_REGIMEN_ESPECIAL: "Comprobante Régimen Especial",
-            ReferenceDocumentType.SUSTITUTO_FACTURA_COMPRA: "Sustituto Factura de Compra",
-            ReferenceDocumentType.PROVEEDOR_NO_DOMICILIADO: "Proveedor No Domiciliado",
-            ReferenceDocumentType.NOTA_CREDITO_FACTURA_COMPRA: "Nota de Crédito a Factura de Compra",
-            ReferenceDocumentType.NOTA_DEBITO_FACTURA_COMPRA: "Nota de Débito a Factura de Compra",
-            ReferenceDocumentType.OTROS: "Otros"
-        }
-        return type_names.get(self.tipo_documento_referencia, "Tipo Desconocido")
+        return _REFERENCE_TYPE_NAMES.get(self.tipo_documento_referencia, "Tipo Desconocido")
     
     def get_reference_code_name(self) -> str:
         """Get human-readable reference code name"""
         if not self.codigo_referencia:
             return "Sin código"
         
-        code_names = {
-            ReferenceCode.ANULA_DOCUMENTO_REFERENCIA: "Anula documento de referencia",
-            ReferenceCode.CORRIGE_TEXTO_DOCUMENTO_REFERENCIA: "Corrige texto del documento de referencia",
-            ReferenceCode.REFERENCIA_OTRO_DOCUMENTO: "Referencia a otro documento",
-            ReferenceCode.SUSTITUYE_COMPROBANTE_CONTINGENCIA: "Sustituye comprobante por contingencia",
-            ReferenceCode.DEVOLUCION_MERCANCIA: "Devolución de mercancía",
-            ReferenceCode.SUSTITUYE_COMPROBANTE_ELECTRONICO: "Sustituye comprobante electrónico",
-            ReferenceCode.FACTURA_ENDOSADA: "Factura endosada",
-            ReferenceCode.NOTA_CREDITO_FINANCIERA: "Nota de crédito financiera",
-            ReferenceCode.NOTA_DEBITO_FINANCIERA: "Nota de débito financiera",
-            ReferenceCode.PROVEEDOR_NO_DOMICILIADO: "Proveedor no domiciliado",
-            ReferenceCode.NOTA_CREDITO_EXONERACION_POSTERIOR: "Nota de crédito por exoneración posterior",
-            ReferenceCode.OTROS: "Otros"
-        }
-        return code_names.get(self.codigo_referencia, "Código Desconocido")
+        return _REFERENCE_CODE_NAMES.get(self.codigo_referencia, "Código Desconocido")
     
     def validate_reference(self) -> bool:
         """Validate reference data consistency"""
@@ -3,6 +3,7 @@ DocumentTax model supporting all Costa Rican tax types and calculations
 """
 import uuid
 from datetime import datetime, timezone
+from types import MappingProxyType
 from decimal import Decimal
 from typing import Optional
 from sqlalchemy import (
@@ -44,6 +45,64 @@ class IVATariffCode(enum.Enum):
     TARIFA_0_SIN_CREDITO = "11"
 
 
+# Default rate percentage per IVA tariff code
+_IVA_DEFAULT_RATES = MappingProxyType({
+    IVATariffCode.TARIFA_0_PERCENT: Decimal('0.00'),
+    IVATariffCode.TARIFA_REDUCIDA_1_PERCENT: Decimal('1.00'),
+    IVATariffCode.TARIFA_REDUCIDA_2_PERCENT: Decimal('2.00'),
+    IVATariffCode.TARIFA_REDUCIDA_4_PERCENT: Decimal('4.00'),
+    IVATariffCode.TRANSITORIO_0_PERCENT: Decimal('0.00'),
+    IVATariffCode.TRANSITORIO_4_PERCENT: Decimal('4.00'),
+    IVATariffCode.TRANSITORIO_8_PERCENT: Decimal('8.00'),
+    IVATariffCode.TARIFA_GENERAL_13_PERCENT: Decimal('13.00'),
+    IVATariffCode.TARIFA_REDUCIDA_0_5_PERCENT: Decimal('0.50'),
+    IVATariffCode.TARIFA_EXENTA: Decimal('0.00'),
+    IVATariffCode.TARIFA_0_SIN_CREDITO: Decimal('0.00')
+})
+
+# Human-readable tax names
+_TAX_NAMES = MappingProxyType({
+    TaxCode.IVA: "Impuesto al Valor Agregado",
+    TaxCode.SELECTIVO_CONSUMO: "Impuesto Selectivo de Consumo",
+    TaxCode.UNICO_COMBUSTIBLES: "Impuesto Único a los Combustibles",
+    TaxCode.ESPECIFICO_BEBIDAS_ALCOHOLICAS: "Impuesto Específico a las Bebidas Alcohólicas",
+    TaxCode.ESPECIFICO_BEBIDAS_SIN_ALCOHOL: "Impuesto Específico a las Bebidas sin Alcohol",
+    TaxCode.PRODUCTOS_TABACO: "Impuesto a los Productos de Tabaco",
+    TaxCode.IVA_CALCULO_ESPECIAL: "IVA Cálculo Especial",
+    TaxCode.IVA_BIENES_USADOS: "IVA Régimen de Bienes Usados",
+    TaxCode.ESPECIFICO_CEMENTO: "Impuesto Específico al Cemento",
+    TaxCode.OTROS: "Otros Impuestos"
+})
+
+# Human-readable IVA tariff names
+_TARIFF_NAMES = MappingProxyType({
+    IVATariffCode.TARIFA_0_PERCENT: "Tarifa 0%",
+    IVATariffCode.TARIFA_REDUCIDA_1_PERCENT: "Tarifa Reducida 1%",
+    IVATariffCode.TARIFA_REDUCIDA_2_PERCENT: "Tarifa Reducida 2%",
+    IVATariffCode.TARIFA_REDUCIDA_4_PERCENT: "Tarifa Reducida 4%",
+    IVATariffCode.TRANSITORIO_0_PERCENT: "Transitorio 0%",
+    IVATariffCode.TRANSITORIO_4_PERCENT: "Transitorio 4%",
+    IVATariffCode.TRANSITORIO_8_PERCENT: "Transitorio 8%",
+    IVATariffCode.TARIFA_GENERAL_13_PERCENT: "Tarifa General 13%",
+    IVATariffCode.TARIFA_REDUCIDA_0_5_PERCENT: "Tarifa Reducida 0.5%",
+    IVATariffCode.TARIFA_EXENTA: "Exenta",
+    IVATariffCode.TARIFA_0_SIN_CREDITO: "0% sin derecho a crédito"
+})
+
+
+# IVA tax codes
+_IVA_TAX_CODES = frozenset({TaxCode.IVA, TaxCode.IVA_CALCULO_ESPECIAL, TaxCode.IVA_BIENES_USADOS})
+
+# Specific (unit-based) tax codes
+_SPECIFIC_TAX_CODES = frozenset({
+    TaxCode.UNICO_COMBUSTIBLES,
+    TaxCode.ESPECIFICO_BEBIDAS_ALCOHOLICAS,
+    TaxCode.ESPECIFICO_BEBIDAS_SIN_ALCOHOL,
+    TaxCode.PRODUCTOS_TABACO,
+    TaxCode.ESPECIFICO_CEMENTO
+})
+
+
 class DocumentTax(Base):
     """
     Tax information for document line items supporting all Costa Rican tax types
@@ -173,18 +232,12 @@ class DocumentTax(Base):
     @property
     def is_iva(self) -> bool:
         """Check if this is an IVA tax"""
-        return self.codigo_impuesto in [TaxCode.IVA, TaxCode.IVA_CALCULO_ESPECIAL, TaxCode.IVA_BIENES_USADOS]
+        return self.codigo_impuesto in _IVA_TAX_CODES
     
     @property
     def is_specific_tax(self) -> bool:
         """Check if this is a specific (unit-based) tax"""
-        return self.codigo_impuesto in [
-            TaxCode.UNICO_COMBUSTIBLES,
-            TaxCode.ESPECIFICO_BEBIDAS_ALCOHOLICAS,
-            TaxCode.ESPECIFICO_BEBIDAS_SIN_ALCOHOL,
-            TaxCode.PRODUCTOS_TABACO,
-            TaxCode.ESPECIFICO_CEMENTO
-        ]
+        return self.codigo_impuesto in _SPECIFIC_TAX_CODES
     
     @property
     def is_selective_tax(self) -> bool:
@@ -209,58 +262,20 @@ class DocumentTax(Base):
         
         # Default rates for IVA tariff codes
         if self.codigo_tarifa_iva:
-            default_rates = {
-                IVATariffCode.TARIFA_0_PERCENT: Decimal('0.00'),
-                IVATariffCode.TARIFA_REDUCIDA_1_PERCENT: Decimal('1.00'),
-                IVATariffCode.TARIFA_REDUCIDA_2_PERCENT: Decimal('2.00'),
-                IVATariffCode.TARIFA_REDUCIDA_4_PERCENT: Decimal('4.00'),
-                IVATariffCode.TRANSITORIO_0_PERCENT: Decimal('0.00'),
-                IVATariffCode.TRANSITORIO_4_PERCENT: Decimal('4.00'),
-                IVATariffCode.TRANSITORIO_8_PERCENT: Decimal('8.00'),
-                IVATariffCode.TARIFA_GENERAL_13_PERCENT: Decimal('13.00'),
-                IVATariffCode.TARIFA_REDUCIDA_0_5_PERCENT: Decimal('0.50'),
-                IVATariffCode.TARIFA_EXENTA: Decimal('0.00'),
-                IVATariffCode.TARIFA_0_SIN_CREDITO: Decimal('0.00')
-            }
-            return default_rates.get(self.codigo_tarifa_iva)
+            return _IVA_DEFAULT_RATES.get(self.codigo_tarifa_iva)
         
         return None
     
     def get_tax_name(self) -> str:
         """Get human-readable tax name"""
-        tax_names = {
-            TaxCode.IVA: "Impuesto al Valor Agregado",
-            TaxCode.SELECTIVO_CONSUMO: "Impuesto Selectivo de Consumo",
-            TaxCode.UNICO_COMBUSTIBLES: "Impuesto Único a los Combustibles",
-            TaxCode.ESPECIFICO_BEBIDAS_ALCOHOLICAS: "Impuesto Específico a las Bebidas Alcohólicas",
-            TaxCode.ESPECIFICO_BEBIDAS_SIN_ALCOHOL: "Impuesto Específico a las Bebidas sin Alcohol",
-            TaxCode.PRODUCTOS_TABACO: "Impuesto a los Productos de Tabaco",
-            TaxCode.IVA_CALCULO_ESPECIAL: "IVA Cálculo Especial",
-            TaxCode.IVA_BIENES_USADOS: "IVA Régimen de Bienes Usados",
-            TaxCode.ESPECIFICO_CEMENTO: "Impuesto Específico al Cemento",
-            TaxCode.OTROS: "Otros Impuestos"
-        }
-        return tax_names.get(self.codigo_impuesto, "Impuesto Desconocido")
+        return _TAX_NAMES.get(self.codigo_impuesto, "Impuesto Desconocido")
     
     def get_tariff_name(self) -> str:
         """Get human-readable IVA tariff name"""
         if not self.codigo_tarifa_iva:
             return "Sin tarifa"
         
-        tariff_names = {
-            IVATariffCode.TARIFA_0_PERCENT: "Tarifa 0%",
-            IVATariffCode.TARIFA_REDUCIDA_1_PERCENT: "Tarifa Reducida 1%",
-            IVATariffCode.TARIFA_REDUCIDA_2_PERCENT: "Tarifa Reducida 2%",
-            IVATariffCode.TARIFA_REDUCIDA_4_PERCENT: "Tarifa Reducida 4%",
-            IVATariffCode.TRANSITORIO_0_PERCENT: "Transitorio 0%",
-            IVATariffCode.TRANSITORIO_4_PERCENT: "Transitorio 4%",
-            IVATariffCode.TRANSITORIO_8_PERCENT: "Transitorio 8%",
-            IVATariffCode.TARIFA_GENERAL_13_PERCENT: "Tarifa General 13%",
-            IVATariffCode.TARIFA_REDUCIDA_0_5_PERCENT: "Tarifa Reducida 0.5%",
-            IVATariffCode.TARIFA_EXENTA: "Exenta",
-            IVATariffCode.TARIFA_0_SIN_CREDITO: "0% sin derecho a crédito"
-        }
-        return tariff_names.get(self.codigo_tarifa_iva, "Tarifa Desconocida")
+        return _TARIFF_NAMES.get(self.codigo_tarifa_iva, "Tarifa Desconocida")
     
     def validate_tax_data(self) -> bool:
         """Validate tax data consistency"""
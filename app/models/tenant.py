@@ -1,19 +1,37 @@
 """
 Tenant model for multi-tenant architecture with certificate storage and plan limits
 """
+import re
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from sqlalchemy import (
     Column, String, Boolean, Integer, DateTime, Text, LargeBinary,
-    CheckConstraint, Index, func
+    CheckConstraint, Index, and_, func, text
 )
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
 
+_NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+
+
+@lru_cache(maxsize=64)
+def _parse_notification_days(value: str) -> Tuple[int, ...]:
+    """Parse comma-separated notification days (most tenants share the default)"""
+    return tuple(int(day) for day in value.split(",") if day.strip())
+
+
+@lru_cache(maxsize=1024)
+def _format_cedula(value: str) -> str:
+    """Legal ID as the 12-digit zero-padded issuer field (cached per distinct ID)"""
+    return _NON_DIGIT_PATTERN.sub("", value).rjust(12, "0")[:12]
+
+
 class Tenant(Base):
     """
     Tenant model for multi-tenant SaaS architecture
@@ -170,6 +188,10 @@ class Tenant(Base):
         # Composite indexes for common queries
         Index("idx_tenants_activo_plan", "activo", "plan"),
         Index("idx_tenants_plan_limite", "plan", "limite_facturas_mes"),
+        
+        # Partial index for certificate expiration scans
+        Index("idx_tenants_cert_expires_active", "certificado_expires_at",
+              postgresql_where=text("certificado_p12 IS NOT NULL AND activo = true")),
     )
     
     def __repr__(self) -> str:
@@ -179,17 +201,35 @@ class Tenant(Base):
         return f"{self.nombre_empresa} ({self.cedula_juridica})"
     
     @property
+    def cedula_juridica_formatted(self) -> str:
+        """Legal ID as the 12-digit zero-padded issuer field used in document keys"""
+        return _format_cedula(self.cedula_juridica)
+    
+    @hybrid_property
     def has_certificate(self) -> bool:
         """Check if tenant has uploaded a certificate"""
         return self.certificado_p12 is not None
     
-    @property
+    @has_certificate.expression
+    def has_certificate(cls):
+        """SQL predicate for has_certificate, usable in query filters"""
+        return cls.certificado_p12.isnot(None)
+    
+    @hybrid_property
     def certificate_expired(self) -> bool:
         """Check if certificate is expired"""
         if not self.certificado_expires_at:
             return False
         return datetime.now(timezone.utc) > self.certificado_expires_at
     
+    @certificate_expired.expression
+    def certificate_expired(cls):
+        """SQL predicate for certificate_expired, usable in query filters"""
+        return and_(
+            cls.certificado_expires_at.isnot(None),
+            cls.certificado_expires_at < func.now()
+        )
+    
     @property
     def certificate_expires_soon(self, days: int = 30) -> bool:
         """Check if certificate expires within specified days"""
@@ -199,6 +239,11 @@ class Tenant(Base):
         warning_date = datetime.now(timezone.utc) + timedelta(days=days)
         return self.certificado_expires_at <= warning_date
     
+    @property
+    def notification_days(self) -> Tuple[int, ...]:
+        """Days before certificate expiration to send notifications"""
+        return _parse_notification_days(self.dias_notificacion_certificado or "")
+    
     @property
     def monthly_limit_reached(self) -> bool:
         """Check if monthly document limit has been reached"""
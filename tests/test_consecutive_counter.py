@@ -0,0 +1,96 @@
+"""
+Tests for ConsecutiveCounter sequential number allocation
+"""
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import ConsecutiveCounter
+from app.models.document import DocumentType
+
+
+TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one(self):
+        return self.value
+
+
+class FakeSession:
+    """Records executed statements and returns a fixed RETURNING value"""
+
+    def __init__(self, last):
+        self.last = last
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return FakeResult(self.last)
+
+
+def compile_sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_reserve_statement_is_single_upsert_returning():
+    """Test allocation compiles to one INSERT ... ON CONFLICT DO UPDATE ... RETURNING"""
+    stmt = ConsecutiveCounter._reserve_statement(
+        TENANT_ID, DocumentType.FACTURA_ELECTRONICA, "001", "00001", 5
+    )
+    sql = " ".join(compile_sql(stmt).split())
+
+    assert sql.startswith("INSERT INTO contadores_consecutivos")
+    assert "ON CONFLICT (tenant_id, tipo_documento, sucursal, terminal) DO UPDATE SET" in sql
+    assert "ultimo_consecutivo = (contadores_consecutivos.ultimo_consecutivo + %(ultimo_consecutivo_1)s)" in sql
+    assert sql.endswith("RETURNING contadores_consecutivos.ultimo_consecutivo")
+
+
+def test_reserve_statement_seeds_from_existing_documents():
+    """Test a new counter starts after the highest number already issued for the prefix"""
+    stmt = ConsecutiveCounter._reserve_statement(
+        TENANT_ID, DocumentType.NOTA_CREDITO_ELECTRONICA, "002", "00010", 3
+    )
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+
+    assert "coalesce(CAST(substr(max(documentos.numero_consecutivo)" in sql
+    assert "FROM documentos WHERE documentos.tenant_id =" in sql
+    assert "documentos.numero_consecutivo BETWEEN" in sql
+    assert "0020001003" + "0000000000" in compiled.params.values()
+    assert "0020001003" + "9999999999" in compiled.params.values()
+    assert 3 in compiled.params.values()
+
+
+def test_reserve_sequentials_returns_reserved_range():
+    """Test the reserved block ends at the RETURNING value"""
+    db = FakeSession(last=15)
+
+    reserved = ConsecutiveCounter.reserve_sequentials(
+        db, TENANT_ID, DocumentType.FACTURA_ELECTRONICA, "001", "00001", 5
+    )
+
+    assert reserved == range(11, 16)
+    assert list(reserved) == [11, 12, 13, 14, 15]
+    assert len(db.statements) == 1
+
+
+def test_next_sequential_returns_single_number():
+    """Test single allocation returns the RETURNING value"""
+    db = FakeSession(last=42)
+
+    assert ConsecutiveCounter.next_sequential(
+        db, TENANT_ID, DocumentType.TIQUETE_ELECTRONICO, "001", "00001"
+    ) == 42
+
+
+def test_reserve_sequentials_rejects_empty_block():
+    """Test count must be positive"""
+    with pytest.raises(ValueError):
+        ConsecutiveCounter.reserve_sequentials(
+            FakeSession(last=0), TENANT_ID, DocumentType.FACTURA_ELECTRONICA, "001", "00001", 0
+        )
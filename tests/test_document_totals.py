@@ -0,0 +1,82 @@
+"""
+Tests for Document.calculate_totals
+"""
+from decimal import Decimal
+
+from app.models import (
+    Document, DocumentDetail, DocumentTax, DocumentExemption, DocumentOtherCharge
+)
+
+
+def make_detail(monto_total, monto_descuento="0", impuestos=()):
+    return DocumentDetail(
+        monto_total=Decimal(monto_total),
+        monto_descuento=Decimal(monto_descuento),
+        impuestos=list(impuestos)
+    )
+
+
+def make_tax(monto, exoneraciones=()):
+    return DocumentTax(
+        monto=Decimal(monto),
+        exoneraciones=[DocumentExemption(monto_exoneracion=Decimal(e)) for e in exoneraciones]
+    )
+
+
+def test_empty_document_totals_are_zero():
+    """Test a document without lines or charges totals zero"""
+    document = Document()
+    document.calculate_totals()
+
+    assert document.total_venta_neta == Decimal("0")
+    assert document.total_descuento == Decimal("0")
+    assert document.total_impuesto == Decimal("0")
+    assert document.total_otros_cargos == Decimal("0")
+    assert document.total_comprobante == Decimal("0")
+
+
+def test_totals_with_discounts_and_multiple_taxes():
+    """Test discounts reduce the net sale and every tax on a line is added"""
+    document = Document(detalles=[
+        make_detail("100.00", "10.00", [make_tax("11.70"), make_tax("5.00")]),
+        make_detail("50.00", impuestos=[make_tax("6.50")]),
+    ])
+    document.calculate_totals()
+
+    assert document.total_descuento == Decimal("10.00")
+    assert document.total_venta_neta == Decimal("140.00")
+    assert document.total_impuesto == Decimal("23.20")
+    assert document.total_comprobante == Decimal("163.20")
+
+
+def test_exemptions_reduce_tax():
+    """Test exempted tax is not charged, fully or partially"""
+    document = Document(
+        detalles=[make_detail("100.00", "10.00", [make_tax("11.70", ["11.70"])])],
+        otros_cargos=[DocumentOtherCharge(monto_cargo=Decimal("5.00"))]
+    )
+    document.calculate_totals()
+
+    assert document.total_impuesto == Decimal("0")
+    assert document.total_comprobante == Decimal("95.00")
+
+    partial = Document(detalles=[make_detail("100.00", impuestos=[make_tax("13.00", ["4.00", "2.00"])])])
+    partial.calculate_totals()
+
+    assert partial.total_impuesto == Decimal("7.00")
+    assert partial.total_comprobante == Decimal("107.00")
+
+
+def test_other_charges_are_added_to_total():
+    """Test other charges are summed separately and included in the final total"""
+    document = Document(
+        detalles=[make_detail("200.00", impuestos=[make_tax("26.00")])],
+        otros_cargos=[
+            DocumentOtherCharge(monto_cargo=Decimal("20.00")),
+            DocumentOtherCharge(monto_cargo=Decimal("2.50")),
+        ]
+    )
+    document.calculate_totals()
+
+    assert document.total_otros_cargos == Decimal("22.50")
+    assert document.total_comprobante == Decimal("248.50")
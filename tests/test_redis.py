@@ -0,0 +1,238 @@
+"""
+Tests for Redis caching utilities
+"""
+import pytest
+
+from app.core import redis as redis_module
+from app.core.redis import CacheService, redis_manager
+
+
+class FakePipeline:
+    """
+    Minimal pipeline over FakeRedis
+
+    client.between_commands, if set, runs between queued commands to simulate keys
+    expiring mid-pipeline; a MULTI/EXEC pipeline is atomic, so it only runs before.
+    """
+
+    def __init__(self, client, transaction):
+        self.client = client
+        self.transaction = transaction
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, *args, **kwargs):
+        self.commands.append((self.client._set, args, kwargs))
+
+    def incrby(self, *args, **kwargs):
+        self.commands.append((self.client._incrby, args, kwargs))
+
+    def expire(self, *args, **kwargs):
+        self.commands.append((self.client._expire, args, kwargs))
+
+    async def execute(self):
+        hook = self.client.between_commands
+        if hook and self.transaction:
+            hook()
+        results = []
+        for index, (command, args, kwargs) in enumerate(self.commands):
+            if hook and not self.transaction and index > 0:
+                hook()
+            results.append(command(*args, **kwargs))
+        self.commands = []
+        return results
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis with decode_responses=True"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.calls = []
+        self.between_commands = None
+
+    def _set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        if isinstance(value, bytes):
+            value = value.decode()
+        self.store[key] = str(value)
+        if ex is not None:
+            self.ttls[key] = ex
+        else:
+            self.ttls.pop(key, None)
+        return True
+
+    def _incrby(self, key, amount=1):
+        value = int(self.store.get(key, 0)) + amount
+        self.store[key] = str(value)
+        return value
+
+    def _expire(self, key, ttl, nx=False):
+        if key not in self.store or (nx and key in self.ttls):
+            return False
+        self.ttls[key] = ttl
+        return True
+
+    async def get(self, key):
+        self.calls.append(("get", key))
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self.calls.append(("mget", tuple(keys)))
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        return self._set(key, value, ex=ex, nx=nx)
+
+    async def setex(self, key, ttl, value):
+        return self._set(key, value, ex=ttl)
+
+    async def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if self.store.pop(key, None) is not None:
+                deleted += 1
+            self.ttls.pop(key, None)
+        return deleted
+
+    async def incrby(self, key, amount=1):
+        return self._incrby(key, amount)
+
+    async def ttl(self, key):
+        if key not in self.store:
+            return -2
+        return self.ttls.get(key, -1)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self, transaction)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point the global Redis manager at an in-memory client with empty L1 caches"""
+    client = FakeRedis()
+    monkeypatch.setattr(redis_manager, "redis_client", client)
+    redis_module._cabys_local_cache.clear()
+    redis_module._certificate_local_cache.clear()
+    yield client
+    redis_module._cabys_local_cache.clear()
+    redis_module._certificate_local_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_cache_cabys_code_fills_both_layers(fake_redis):
+    """Test that caching a CABYS code writes Redis and the in-process cache"""
+    await CacheService.cache_cabys_code("1234567890123", {"descripcion": "Arroz"})
+
+    assert "cabys:1234567890123" in fake_redis.store
+    assert "1234567890123" in redis_module._cabys_local_cache
+
+    assert await CacheService.get_cabys_code("1234567890123") == {"descripcion": "Arroz"}
+    assert ("get", "cabys:1234567890123") not in fake_redis.calls
+
+
+@pytest.mark.asyncio
+async def test_get_cabys_code_falls_back_to_redis(fake_redis):
+    """Test L1 miss reads Redis once and populates L1"""
+    fake_redis.store["cabys:1234567890123"] = '{"descripcion": "Frijoles"}'
+
+    assert await CacheService.get_cabys_code("1234567890123") == {"descripcion": "Frijoles"}
+    assert await CacheService.get_cabys_code("1234567890123") == {"descripcion": "Frijoles"}
+    assert fake_redis.calls.count(("get", "cabys:1234567890123")) == 1
+
+    assert await CacheService.get_cabys_code("9999999999999") is None
+    assert "9999999999999" not in redis_module._cabys_local_cache
+
+
+@pytest.mark.asyncio
+async def test_get_cabys_code_returns_independent_copies(fake_redis):
+    """Test callers mutating a result do not corrupt the cache"""
+    await CacheService.cache_cabys_code("1234567890123", {"descripcion": "Arroz", "impuestos": [13]})
+
+    first = await CacheService.get_cabys_code("1234567890123")
+    first["descripcion"] = "Modificado"
+    first["impuestos"].append(1)
+
+    assert await CacheService.get_cabys_code("1234567890123") == {"descripcion": "Arroz", "impuestos": [13]}
+
+
+@pytest.mark.asyncio
+async def test_get_cabys_codes_uses_mget_for_misses(fake_redis):
+    """Test bulk lookup serves L1 hits locally and MGETs only the misses"""
+    await CacheService.cache_cabys_code("1111111111111", {"descripcion": "Local"})
+    fake_redis.store["cabys:2222222222222"] = '{"descripcion": "Remoto"}'
+
+    result = await CacheService.get_cabys_codes(["1111111111111", "2222222222222", "3333333333333"])
+
+    assert result == {
+        "1111111111111": {"descripcion": "Local"},
+        "2222222222222": {"descripcion": "Remoto"},
+        "3333333333333": None,
+    }
+    assert fake_redis.calls == [("mget", ("cabys:2222222222222", "cabys:3333333333333"))]
+    assert "2222222222222" in redis_module._cabys_local_cache
+
+    result["1111111111111"]["descripcion"] = "Modificado"
+    assert (await CacheService.get_cabys_codes(["1111111111111"]))["1111111111111"] == {"descripcion": "Local"}
+
+
+@pytest.mark.asyncio
+async def test_increment_with_ttl_keeps_original_window(fake_redis):
+    """Test the counter increments, gets a TTL on first use, and later calls keep it"""
+    assert await redis_manager.increment_with_ttl("rate_limit:t1:basico", 3600) == 1
+    assert await fake_redis.ttl("rate_limit:t1:basico") == 3600
+
+    # Simulate time passing inside the window
+    fake_redis.ttls["rate_limit:t1:basico"] = 1200
+
+    assert await redis_manager.increment_with_ttl("rate_limit:t1:basico", 3600) == 2
+    assert await redis_manager.increment_with_ttl("rate_limit:t1:basico", 3600, amount=3) == 5
+    assert await fake_redis.ttl("rate_limit:t1:basico") == 1200
+
+
+@pytest.mark.asyncio
+async def test_increment_with_ttl_survives_expiry_between_steps(fake_redis):
+    """Test a window expiring mid-increment still leaves the new counter with a TTL"""
+    fake_redis._set("rate_limit:t1:basico", 49, ex=1)
+
+    def expire_window():
+        fake_redis.store.pop("rate_limit:t1:basico", None)
+        fake_redis.ttls.pop("rate_limit:t1:basico", None)
+        fake_redis.between_commands = None
+
+    fake_redis.between_commands = expire_window
+
+    assert await redis_manager.increment_with_ttl("rate_limit:t1:basico", 3600) == 1
+    assert await fake_redis.ttl("rate_limit:t1:basico") == 3600
+
+
+@pytest.mark.asyncio
+async def test_get_certificate_returns_independent_copies(fake_redis):
+    """Test mutating a returned certificate does not affect later reads"""
+    await CacheService.cache_certificate("tenant-1", {"p12": "YWJj", "meta": {"alias": "firma"}})
+
+    certificate = await CacheService.get_certificate("tenant-1")
+    certificate["p12"] = b"abc"
+    certificate["meta"]["alias"] = "otro"
+
+    assert await CacheService.get_certificate("tenant-1") == {"p12": "YWJj", "meta": {"alias": "firma"}}
+    assert ("get", "cert:tenant-1") not in fake_redis.calls
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tenant_cache_clears_both_layers(fake_redis):
+    """Test invalidation drops the in-process entry as well as the Redis key"""
+    await CacheService.cache_certificate("tenant-1", {"p12": "YWJj"})
+
+    await CacheService.invalidate_tenant_cache("tenant-1")
+
+    assert "tenant-1" not in redis_module._certificate_local_cache
+    assert "cert:tenant-1" not in fake_redis.store
+    assert await CacheService.get_certificate("tenant-1") is None
@@ -0,0 +1,19 @@
+"""
+Tests for Tenant model helpers
+"""
+from app.models import Tenant
+
+
+def test_cedula_juridica_formatted_pads_to_twelve_digits():
+    """Test the legal ID is stripped of separators and zero-padded"""
+    tenant = Tenant(cedula_juridica="3-101-123456")
+    assert tenant.cedula_juridica_formatted == "003101123456"
+
+
+def test_cedula_juridica_formatted_follows_updates():
+    """Test the formatted ID reflects changes to cedula_juridica"""
+    tenant = Tenant(cedula_juridica="3-101-123456")
+    assert tenant.cedula_juridica_formatted == "003101123456"
+
+    tenant.cedula_juridica = "3-102-999999"
+    assert tenant.cedula_juridica_formatted == "003102999999"